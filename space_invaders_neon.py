@@ -1,11 +1,12 @@
-import math
+import functools
 import os
 import random
-import struct
 import sys
 import time
 import wave
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pygame
 
 
@@ -14,6 +15,8 @@ import pygame
 # ---------------------------
 WIDTH, HEIGHT = 960, 720
 FPS = 60
+SIM_STEP = 1.0 / 120  # fixed simulation timestep (s); shorter than a frame so every frame advances
+MAX_FRAME_TIME = 0.25  # clamp on real time fed to the simulation after a stall
 TITLE = "Neon Space Invaders"
 
 # Visual toggles
@@ -22,6 +25,9 @@ STARFIELD_LAYERS = 3
 PARTICLE_COUNT = 120
 SCREEN_SHAKE = True
 
+# Collision grid cell size (px); roughly one enemy sprite wide
+COLLISION_CELL = 48
+
 # Paths
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 SOUNDS_DIR = os.path.join(ASSETS_DIR, "sounds")
@@ -38,6 +44,17 @@ def lerp(a, b, t):
     return a + (b - a) * t
 
 
+def compact(lst, attr="alive"):
+    # Drop dead entries in place via swap-and-pop: no new list, but order is not preserved
+    i = 0
+    while i < len(lst):
+        if getattr(lst[i], attr):
+            i += 1
+        else:
+            lst[i] = lst[-1]
+            lst.pop()
+
+
 def ensure_dirs():
     os.makedirs(SOUNDS_DIR, exist_ok=True)
 
@@ -48,51 +65,61 @@ def write_wav(path, frames, sample_rate=44100):
         wf.setsampwidth(2)  # 16-bit
         wf.setframerate(sample_rate)
         # Convert float [-1,1] to 16-bit signed
-        data = b"".join(struct.pack('<h', int(clamp(x, -1.0, 1.0) * 32767)) for x in frames)
-        wf.writeframes(data)
+        arr = np.array(frames, dtype=np.float32)  # private copy; clipped and scaled in place
+        np.clip(arr, -1.0, 1.0, out=arr)
+        arr *= 32767.0
+        pcm = arr.astype("<i2")
+        wf.writeframes(pcm.tobytes())
 
 
 def synth_tone(freq=880.0, dur=0.15, vol=0.5, wave_type="sine", sample_rate=44100, decay=0.002):
     n = int(dur * sample_rate)
-    frames = []
-    for i in range(n):
-        t = i / sample_rate
-        env = math.exp(-decay * i)  # simple decay envelope
-        if wave_type == "sine":
-            s = math.sin(2 * math.pi * freq * t)
-        elif wave_type == "square":
-            s = 1.0 if math.sin(2 * math.pi * freq * t) >= 0 else -1.0
-        elif wave_type == "triangle":
-            s = 2.0 * abs(2.0 * ((t * freq) % 1.0) - 1.0) - 1.0
-        else:
-            s = 0.0
-        frames.append(vol * env * s)
-    return frames
+    i = np.arange(n, dtype=np.float64)
+    env = np.exp(-decay * i)  # simple decay envelope
+    # Phase accumulator in cycles, wrapped to [0, 1); every waveform derives from it
+    phase = (i * freq / sample_rate) % 1.0
+    if wave_type == "sine":
+        s = np.sin(2 * np.pi * phase)
+    elif wave_type == "square":
+        s = np.where(phase < 0.5, 1.0, -1.0)
+    elif wave_type == "triangle":
+        s = 2.0 * np.abs(2.0 * phase - 1.0) - 1.0
+    else:
+        s = np.zeros(n)
+    return (vol * env * s).astype(np.float32)
 
 
 def synth_noise(dur=0.35, vol=0.45, sample_rate=44100):
     n = int(dur * sample_rate)
-    frames = []
-    for i in range(n):
-        env = math.exp(-0.008 * i)  # faster decay for explosion
-        s = (random.random() * 2.0 - 1.0)
-        frames.append(vol * env * s)
-    return frames
+    env = np.exp(-0.008 * np.arange(n))  # faster decay for explosion
+    s = np.random.uniform(-1.0, 1.0, n)
+    return (vol * env * s).astype(np.float32)
 
 
 def generate_sounds():
     ensure_dirs()
+    # Synthesizers are deferred so only missing files are generated, in parallel
+    # (NumPy kernels and file writes release the GIL)
     files = {
-        "laser.wav": synth_tone(freq=1200, dur=0.09, vol=0.55, wave_type="square", decay=0.008),
-        "powerup.wav": synth_tone(freq=600, dur=0.12, vol=0.5, wave_type="triangle", decay=0.006)
-        + synth_tone(freq=900, dur=0.12, vol=0.4, wave_type="triangle", decay=0.006),
-        "explosion.wav": synth_noise(dur=0.4, vol=0.6),
-        "hit.wav": synth_tone(freq=320, dur=0.06, vol=0.45, wave_type="sine", decay=0.02),
+        "laser.wav": lambda: synth_tone(freq=1200, dur=0.09, vol=0.55, wave_type="square", decay=0.008),
+        "powerup.wav": lambda: np.concatenate([
+            synth_tone(freq=600, dur=0.12, vol=0.5, wave_type="triangle", decay=0.006),
+            synth_tone(freq=900, dur=0.12, vol=0.4, wave_type="triangle", decay=0.006),
+        ]),
+        "explosion.wav": lambda: synth_noise(dur=0.4, vol=0.6),
+        "hit.wav": lambda: synth_tone(freq=320, dur=0.06, vol=0.45, wave_type="sine", decay=0.02),
     }
-    for name, frames in files.items():
-        path = os.path.join(SOUNDS_DIR, name)
-        if not os.path.exists(path):
-            write_wav(path, frames)
+    missing = [(os.path.join(SOUNDS_DIR, name), synth) for name, synth in files.items()
+               if not os.path.exists(os.path.join(SOUNDS_DIR, name))]
+    if not missing:
+        return
+
+    def gen_one(job):
+        path, synth = job
+        write_wav(path, synth())
+
+    with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+        list(ex.map(gen_one, missing))
 
 
 def load_sounds():
@@ -111,6 +138,9 @@ def load_sounds():
 # ---------------------------
 # Visual helpers
 # ---------------------------
+# Sprite factories are memoized: entities sharing a style share one read-only surface.
+# They return display-format surfaces, so call them only after pygame.display.set_mode.
+@functools.lru_cache(maxsize=128)
 def neon_circle(radius, color, glow=3):
     size = radius * 2 + glow * 6
     surf = pygame.Surface((size, size), pygame.SRCALPHA)
@@ -123,9 +153,10 @@ def neon_circle(radius, color, glow=3):
             pygame.draw.circle(surf, (*color, alpha), (cx, cy), r + i * 3)
     # Core
     pygame.draw.circle(surf, (*color, 255), (cx, cy), r)
-    return surf
+    return surf.convert_alpha()
 
 
+@functools.lru_cache(maxsize=128)
 def neon_rect(size, color, glow=3, border_radius=8):
     w, h = size
     pad = glow * 4
@@ -136,7 +167,16 @@ def neon_rect(size, color, glow=3, border_radius=8):
             alpha = int(16 * i)
             pygame.draw.rect(surf, (*color, alpha), rect.inflate(i * 6, i * 6), border_radius=border_radius)
     pygame.draw.rect(surf, (*color, 255), rect, border_radius=border_radius)
-    return surf
+    return surf.convert_alpha()
+
+
+@functools.lru_cache(maxsize=None)
+def particle_sprite(color, radius, alpha_bucket):
+    # Particle alpha is quantized to 16 levels (alpha >> 4), so this LUT stays small
+    alpha = min(255, (alpha_bucket << 4) + 8)
+    surf = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(surf, (*color, alpha), (radius, radius), radius)
+    return surf.convert_alpha()
 
 
 def additive_blit(dst, src, pos):
@@ -164,76 +204,134 @@ class StarField:
             count = 80 * (i + 1)
             speed = 20 * (i + 1)
             color = (80 + 40 * i, 120 + 45 * i, 200 + 20 * i)
-            stars = []
-            for _ in range(count):
-                x = random.random() * w
-                y = random.random() * h
-                size = 1 + i
-                stars.append([x, y, size])
-            self.layers.append({"stars": stars, "speed": speed, "color": color})
+            xy = np.empty((count, 2), dtype=np.float32)
+            xy[:, 0] = np.random.uniform(0, w, count)
+            xy[:, 1] = np.random.uniform(0, h, count)
+            self.layers.append({"xy": xy, "speed": speed, "color": color, "size": 1 + i})
 
     def update(self, dt):
         for layer in self.layers:
-            for s in layer["stars"]:
-                s[1] += layer["speed"] * dt
-                if s[1] > self.h:
-                    s[0] = random.random() * self.w
-                    s[1] = -5
+            xy = layer["xy"]
+            xy[:, 1] += layer["speed"] * dt
+            wrap = xy[:, 1] > self.h
+            if wrap.any():
+                xy[wrap, 1] = -5
+                xy[wrap, 0] = np.random.uniform(0, self.w, int(wrap.sum()))
 
     def draw(self, surf):
+        # Stars are written straight into the pixel array, one vectorized store per layer offset
+        w, h = surf.get_size()
+        pixels = pygame.surfarray.pixels3d(surf)
         for layer in self.layers:
-            color = layer["color"]
-            for x, y, size in layer["stars"]:
-                pygame.draw.rect(surf, color, (int(x), int(y), size, size))
-
-
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-220, 220)
-        self.vy = random.uniform(-240, 60)
-        self.life = random.uniform(0.4, 0.9)
-        self.age = 0.0
-        self.color = color
-        self.radius = random.randint(1, 3)
+            xy = layer["xy"].astype(np.int32)
+            size = layer["size"]
+            for dx in range(size):
+                for dy in range(size):
+                    xs = xy[:, 0] + dx
+                    ys = xy[:, 1] + dy
+                    inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+                    pixels[xs[inside], ys[inside]] = layer["color"]
+        del pixels  # unlock the surface before further blits
+
+
+class ParticleSystem:
+    """パーティクルを並列配列（SoA）で保持し、NumPy で一括更新する"""
+
+    COMPACT_INTERVAL = 4  # frames between dead-slot compactions
+
+    def __init__(self, capacity=PARTICLE_COUNT * 4):
+        self.capacity = capacity
+        self.count = 0
+        self.frame = 0
+        self.px = np.zeros(capacity, dtype=np.float32)
+        self.py = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.age = np.zeros(capacity, dtype=np.float32)
+        self.life = np.ones(capacity, dtype=np.float32)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self.color_idx = np.zeros(capacity, dtype=np.int32)
+        self.colors = []  # palette referenced by color_idx
+
+    def _arrays(self):
+        return (self.px, self.py, self.vx, self.vy, self.age, self.life, self.radius, self.color_idx)
+
+    def _color_index(self, color):
+        if color not in self.colors:
+            self.colors.append(color)
+        return self.colors.index(color)
+
+    def spawn(self, x, y, color, k):
+        if self.count + k > self.capacity:
+            self.compact()
+        k = min(k, self.capacity - self.count)
+        if k <= 0:
+            return
+        sl = slice(self.count, self.count + k)
+        self.px[sl] = x
+        self.py[sl] = y
+        self.vx[sl] = np.random.uniform(-220, 220, k)
+        self.vy[sl] = np.random.uniform(-240, 60, k)
+        self.life[sl] = np.random.uniform(0.4, 0.9, k)
+        self.age[sl] = 0.0
+        self.radius[sl] = np.random.randint(1, 4, k)
+        self.color_idx[sl] = self._color_index(color)
+        self.count += k
 
     def update(self, dt):
-        self.age += dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy += 420 * dt  # gravity-like
-
-    def alive(self):
-        return self.age < self.life
+        n = self.count
+        self.age[:n] += dt
+        self.px[:n] += self.vx[:n] * dt
+        self.py[:n] += self.vy[:n] * dt
+        self.vy[:n] += 420 * dt  # gravity-like
+        self.frame += 1
+        if self.frame % self.COMPACT_INTERVAL == 0:
+            self.compact()
+
+    def compact(self):
+        # Dead slots linger until here; draw() skips them since their alpha is 0
+        n = self.count
+        alive = self.age[:n] < self.life[:n]
+        k = int(np.count_nonzero(alive))
+        if k == n:
+            return
+        for arr in self._arrays():
+            arr[:k] = arr[:n][alive]
+        self.count = k
 
     def draw(self, surf):
-        t = clamp(1 - self.age / self.life, 0, 1)
-        alpha = int(220 * t)
-        if alpha <= 0:
-            return
-        pygame.draw.circle(surf, (*self.color, alpha), (int(self.x), int(self.y)), self.radius)
+        n = self.count
+        t = np.clip(1 - self.age[:n] / self.life[:n], 0, 1)
+        alpha = (220 * t).astype(np.int32)
+        xs = self.px[:n].astype(np.int32)
+        ys = self.py[:n].astype(np.int32)
+        blits = []
+        for x, y, r, c, a in zip(xs.tolist(), ys.tolist(), self.radius[:n].tolist(),
+                                 self.color_idx[:n].tolist(), alpha.tolist()):
+            if a <= 0:
+                continue
+            blits.append((particle_sprite(self.colors[c], r, a >> 4), (x - r, y - r), None, pygame.BLEND_ADD))
+        surf.blits(blits, doreturn=False)
 
 
 class Bullet:
-    def __init__(self, x, y, color=NEON_YELLOW):
+    # Shared by every player bullet; set up by Game.__init__ once the display exists
+    SPRITE = None
+    W, H = 0, 0
+    SPEED = -680
+
+    def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.speed = -680
         self.alive = True
-        self.sprite = neon_rect((4, 18), color, glow=2)
 
     def update(self, dt):
-        self.y += self.speed * dt
+        self.y += Bullet.SPEED * dt
         if self.y < -40:
             self.alive = False
 
     def rect(self):
-        w, h = self.sprite.get_size()
-        return pygame.Rect(int(self.x - w // 2), int(self.y - h // 2), w, h)
-
-    def draw(self, surf):
-        additive_blit(surf, self.sprite, (self.rect().x, self.rect().y))
+        return pygame.Rect(int(self.x - Bullet.W // 2), int(self.y - Bullet.H // 2), Bullet.W, Bullet.H)
 
 
 class EnemyBullet:
@@ -255,36 +353,76 @@ class EnemyBullet:
         w, h = self.sprite.get_size()
         return pygame.Rect(int(self.x - w // 2), int(self.y - h // 2), w, h)
 
-    def draw(self, surf):
-        additive_blit(surf, self.sprite, (self.rect().x, self.rect().y))
 
+ENEMY_COLORS = [NEON_MAGENTA, NEON_CYAN, NEON_LIME, NEON_ORANGE]
 
-class Enemy:
-    def __init__(self, x, y, kind=0):
-        self.x = x
-        self.y = y
-        self.base_y = y
-        self.kind = kind
-        self.alive = True
-        self.timer = random.random() * 100
-        colors = [NEON_MAGENTA, NEON_CYAN, NEON_LIME, NEON_ORANGE]
-        self.color = colors[kind % len(colors)]
+
+class EnemySwarm:
+    """敵編隊を並列配列（SoA）で保持し、軌道の三角関数を NumPy で一括計算する"""
+
+    FIELDS = ("x", "base_y", "y", "timer", "wobble", "kind", "size", "alive")
+
+    def __init__(self):
+        self.x = np.zeros(0)
+        self.base_y = np.zeros(0)
+        self.y = np.zeros(0)
+        self.timer = np.zeros(0)
+        self.wobble = np.zeros(0)
+        self.kind = np.zeros(0, dtype=np.int32)
+        self.size = np.zeros(0, dtype=np.int32)  # sprite width/height (square)
+        self.alive = np.zeros(0, dtype=bool)
+
+    def __len__(self):
+        return len(self.x)
+
+    @staticmethod
+    def sprite(kind):
         size = 22 + kind * 4
-        self.sprite = neon_rect((size, size), self.color, glow=3, border_radius=6)
-        self.wobble = 8 + kind * 2
-        self.speed = 40 + kind * 10
+        return neon_rect((size, size), ENEMY_COLORS[kind % len(ENEMY_COLORS)], glow=3, border_radius=6)
+
+    def color(self, i):
+        return ENEMY_COLORS[self.kind[i] % len(ENEMY_COLORS)]
+
+    def spawn(self, xs, ys, kinds):
+        n = len(kinds)
+        kinds = np.asarray(kinds, dtype=np.int32)
+        ys = np.asarray(ys, dtype=np.float64)
+        self.x = np.concatenate([self.x, np.asarray(xs, dtype=np.float64)])
+        self.base_y = np.concatenate([self.base_y, ys])
+        self.y = np.concatenate([self.y, ys])
+        self.timer = np.concatenate([self.timer, np.random.uniform(0, 100, n)])
+        self.wobble = np.concatenate([self.wobble, 8 + kinds * 2.0])
+        self.kind = np.concatenate([self.kind, kinds])
+        sizes = [self.sprite(k).get_width() for k in kinds.tolist()]
+        self.size = np.concatenate([self.size, np.asarray(sizes, dtype=np.int32)])
+        self.alive = np.concatenate([self.alive, np.ones(n, dtype=bool)])
 
     def update(self, dt, t):
         self.timer += dt
-        self.y = self.base_y + math.sin(t * 2 + self.x * 0.01) * self.wobble
-        self.x += math.sin(t * 0.7 + self.timer * 0.6) * 20 * dt
+        self.y = self.base_y + np.sin(t * 2 + self.x * 0.01) * self.wobble
+        self.x += np.sin(t * 0.7 + self.timer * 0.6) * 20 * dt
+        self.base_y += 4 * dt  # downward drift over time
 
-    def rect(self):
-        w, h = self.sprite.get_size()
-        return pygame.Rect(int(self.x - w // 2), int(self.y - h // 2), w, h)
+    def topleft(self):
+        half = self.size // 2
+        return (self.x - half).astype(np.int32), (self.y - half).astype(np.int32)
 
-    def draw(self, surf):
-        additive_blit(surf, self.sprite, (self.rect().x, self.rect().y))
+    def rects(self):
+        xs, ys = self.topleft()
+        return [pygame.Rect(x, y, s, s) for x, y, s in zip(xs.tolist(), ys.tolist(), self.size.tolist())]
+
+    def blits(self):
+        xs, ys = self.topleft()
+        return [(self.sprite(k), (x, y), None, pygame.BLEND_ADD)
+                for k, x, y in zip(self.kind.tolist(), xs.tolist(), ys.tolist())]
+
+    def kill(self, i):
+        self.alive[i] = False
+
+    def compact(self):
+        keep = self.alive
+        for name in self.FIELDS:
+            setattr(self, name, getattr(self, name)[keep])
 
 
 class PowerUp:
@@ -304,9 +442,6 @@ class PowerUp:
         w, h = self.sprite.get_size()
         return pygame.Rect(int(self.x - w // 2), int(self.y - h // 2), w, h)
 
-    def draw(self, surf):
-        additive_blit(surf, self.sprite, (self.rect().x, self.rect().y))
-
 
 class Player:
     def __init__(self):
@@ -376,6 +511,14 @@ class Game:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("Arial", 24)
         self.big_font = pygame.font.SysFont("Arial", 64, bold=True)
+        # HUD caches: text is re-rendered only when the value changes
+        self._score_val = self._wave_val = None
+        self._score_surf = self._wave_surf = None
+        self._lives_ship = neon_rect((20, 12), NEON_CYAN, glow=2, border_radius=6)
+        # world surface for additive blits, allocated once and cleared each frame
+        self.world = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        Bullet.SPRITE = neon_rect((4, 18), NEON_YELLOW, glow=2)
+        Bullet.W, Bullet.H = Bullet.SPRITE.get_size()
 
         generate_sounds()
         self.sounds = load_sounds()
@@ -386,9 +529,9 @@ class Game:
         self.player = Player()
         self.bullets = []
         self.enemy_bullets = []
-        self.enemies = []
+        self.enemies = EnemySwarm()
         self.powerups = []
-        self.particles = []
+        self.particles = ParticleSystem()
         self.starfield = StarField(WIDTH, HEIGHT, layers=STARFIELD_LAYERS)
         self.spawn_wave(1)
         self.wave = 1
@@ -411,8 +554,7 @@ class Game:
             s.set_volume(0.5)
             s.play()
         # ささやかな被弾エフェクト
-        for _ in range(20):
-            self.particles.append(Particle(self.player.x, self.player.y, NEON_CYAN))
+        self.particles.spawn(self.player.x, self.player.y, NEON_CYAN, 20)
         if self.lives <= 0:
             self.game_over = True
 
@@ -422,11 +564,13 @@ class Game:
         spacing_x = WIDTH // (cols + 1)
         spacing_y = 64
         offset_y = 80
+        xs, ys, kinds = [], [], []
         for r in range(rows):
             for c in range(cols):
-                x = spacing_x * (c + 1)
-                y = offset_y + r * spacing_y
-                self.enemies.append(Enemy(x, y, kind=(r % 4)))
+                xs.append(spacing_x * (c + 1))
+                ys.append(offset_y + r * spacing_y)
+                kinds.append(r % 4)
+        self.enemies.spawn(xs, ys, kinds)
 
     def update(self, dt):
         if self.game_over:
@@ -439,71 +583,86 @@ class Game:
 
         for b in self.bullets:
             b.update(dt)
-        self.bullets = [b for b in self.bullets if b.alive]
-
-        for e in self.enemies:
-            e.update(dt, self.time)
-            # 日本語コメント: 敵のランダム射撃（確率はdtに比例）
-            if random.random() < 0.35 * dt:
-                self.enemy_bullets.append(EnemyBullet(e.x, e.y + 20, color=e.color))
-        # Enemies downward drift over time
-        for e in self.enemies:
-            e.base_y += 4 * dt
-            if e.base_y > HEIGHT - 140:
-                self.game_over = True
-
-        # Collisions bullets -> enemies
-        for b in list(self.bullets):
+        compact(self.bullets)
+
+        enemies = self.enemies
+        enemies.update(dt, self.time)
+        # 日本語コメント: 敵のランダム射撃（確率はdtに比例）
+        for i in np.flatnonzero(np.random.random(len(enemies)) < 0.35 * dt).tolist():
+            self.enemy_bullets.append(EnemyBullet(float(enemies.x[i]), float(enemies.y[i]) + 20, color=enemies.color(i)))
+        if len(enemies) and enemies.base_y.max() > HEIGHT - 140:
+            self.game_over = True
+
+        # Collisions bullets -> enemies (uniform spatial hash, 3x3 neighborhood per bullet)
+        grid = {}
+        cxs = (enemies.x.astype(np.int32) // COLLISION_CELL).tolist()
+        cys = (enemies.y.astype(np.int32) // COLLISION_CELL).tolist()
+        for i, cell in enumerate(zip(cxs, cys)):
+            grid.setdefault(cell, []).append(i)
+        rects = enemies.rects()
+        # Bounding box of the whole formation: bullets outside it (most of them, still
+        # climbing from the player) skip the hash lookup entirely
+        formation = rects[0].unionall(rects[1:]) if rects else pygame.Rect(0, 0, 0, 0)
+        killed = set()
+        for b in self.bullets:
             br = b.rect()
-            for e in list(self.enemies):
-                if br.colliderect(e.rect()):
-                    self.score += 10
-                    b.alive = False
-                    e.alive = False
-                    self.explode(e.x, e.y, e.color)
-                    if random.random() < 0.07:
-                        self.powerups.append(PowerUp(e.x, e.y))
-                    s = self.sounds.get("hit") or self.sounds.get("explosion")
-                    if s:
-                        s.set_volume(0.5)
-                        s.play()
-                    if SCREEN_SHAKE:
-                        self.shake = 8
-        self.enemies = [e for e in self.enemies if e.alive]
+            if not br.colliderect(formation):
+                continue
+            cx, cy = int(b.x) // COLLISION_CELL, int(b.y) // COLLISION_CELL
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for i in grid.get((cx + dx, cy + dy), ()):
+                        if not br.colliderect(rects[i]):
+                            continue
+                        b.alive = False
+                        # Enemies already hit this frame still absorb bullets, but score only once
+                        if i in killed:
+                            continue
+                        killed.add(i)
+                        enemies.kill(i)
+                        ex, ey = float(enemies.x[i]), float(enemies.y[i])
+                        self.score += 10
+                        self.explode(ex, ey, enemies.color(i))
+                        if random.random() < 0.07:
+                            self.powerups.append(PowerUp(ex, ey))
+                        s = self.sounds.get("hit") or self.sounds.get("explosion")
+                        if s:
+                            s.set_volume(0.5)
+                            s.play()
+                        if SCREEN_SHAKE:
+                            self.shake = 8
+        if killed:
+            enemies.compact()
 
         # 日本語コメント: 敵弾の更新
         for eb in self.enemy_bullets:
             eb.update(dt)
-        self.enemy_bullets = [eb for eb in self.enemy_bullets if eb.alive]
+        compact(self.enemy_bullets)
 
         # Power-ups
+        pr = self.player.rect()
         for p in self.powerups:
             p.update(dt)
-            if p.rect().colliderect(self.player.rect()):
+            if p.rect().colliderect(pr):
                 self.player.multi = min(5, self.player.multi + 1)
                 p.alive = False
                 s = self.sounds.get("powerup")
                 if s:
                     s.set_volume(0.45)
                     s.play()
-        self.powerups = [p for p in self.powerups if p.alive]
+        compact(self.powerups)
 
-        # 日本語コメント: プレイヤーと敵弾の衝突
-        pr = self.player.rect()
-        for eb in list(self.enemy_bullets):
-            if eb.rect().colliderect(pr):
-                eb.alive = False
-                self.damage_player()
+        # 日本語コメント: プレイヤーと敵弾の衝突（矩形判定は collidelistall で C 側に一括）
+        for i in pr.collidelistall([eb.rect() for eb in self.enemy_bullets]):
+            self.enemy_bullets[i].alive = False
+            self.damage_player()
 
-        # 日本語コメント: プレイヤーと敵本体の衝突
-        for e in self.enemies:
-            if e.rect().colliderect(pr):
-                self.damage_player()
+        # 日本語コメント: プレイヤーと敵本体の衝突（無敵時間があるので最初の1体で十分）
+        if pr.collidelist(self.enemies.rects()) != -1:
+            self.damage_player()
 
         # Particles
-        for pa in self.particles:
-            pa.update(dt)
-        self.particles = [pa for pa in self.particles if pa.alive()]
+        self.particles.update(dt)
 
         # Starfield
         self.starfield.update(dt)
@@ -517,8 +676,7 @@ class Game:
         self.shake = max(0, self.shake - 60 * dt)
 
     def explode(self, x, y, color):
-        for _ in range(PARTICLE_COUNT // 6):
-            self.particles.append(Particle(x, y, color))
+        self.particles.spawn(x, y, color, PARTICLE_COUNT // 6)
         ex = self.sounds.get("explosion")
         if ex:
             ex.set_volume(0.6)
@@ -526,15 +684,18 @@ class Game:
 
     def draw_hud(self, surf):
         # Score
-        score_s = self.font.render(f"Score {self.score}", True, UI_WHITE)
-        surf.blit(score_s, (16, 12))
+        if self.score != self._score_val:
+            self._score_surf = self.font.render(f"Score {self.score}", True, UI_WHITE)
+            self._score_val = self.score
+        surf.blit(self._score_surf, (16, 12))
         # Wave
-        wave_s = self.font.render(f"Wave {self.wave}", True, UI_WHITE)
-        surf.blit(wave_s, (WIDTH - 140, 12))
+        if self.wave != self._wave_val:
+            self._wave_surf = self.font.render(f"Wave {self.wave}", True, UI_WHITE)
+            self._wave_val = self.wave
+        surf.blit(self._wave_surf, (WIDTH - 140, 12))
         # Lives (visualized as small neon ships)
         for i in range(self.lives):
-            ship = neon_rect((20, 12), NEON_CYAN, glow=2, border_radius=6)
-            additive_blit(surf, ship, (16 + i * 26, 44))
+            additive_blit(surf, self._lives_ship, (16 + i * 26, 44))
 
     def draw_title(self, surf):
         title = self.big_font.render("NEON INVADERS", True, UI_WHITE)
@@ -558,19 +719,16 @@ class Game:
         if self.shake > 0 and SCREEN_SHAKE:
             base_offset = (random.randint(-int(self.shake), int(self.shake)), random.randint(-int(self.shake), int(self.shake)))
 
-        # world surface for additive blits
-        world = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        world = self.world
+        world.fill((0, 0, 0, 0))
         # entities
-        for p in self.particles:
-            p.draw(world)
-        for b in self.bullets:
-            b.draw(world)
-        for eb in self.enemy_bullets:
-            eb.draw(world)
-        for e in self.enemies:
-            e.draw(world)
-        for p in self.powerups:
-            p.draw(world)
+        self.particles.draw(world)
+        # Sprites go through a single batched blits() call instead of one blit per entity
+        blits = [(Bullet.SPRITE, b.rect().topleft, None, pygame.BLEND_ADD) for b in self.bullets]
+        for group in (self.enemy_bullets, self.powerups):
+            blits.extend((o.sprite, o.rect().topleft, None, pygame.BLEND_ADD) for o in group)
+        blits.extend(self.enemies.blits())
+        world.blits(blits, doreturn=False)
         self.player.draw(world)
 
         # Additive composite
@@ -587,6 +745,7 @@ class Game:
     def run(self):
         show_title = True
         title_time = 2.0
+        acc = 0.0
         while True:
             dt = self.clock.tick(FPS) / 1000.0
             for event in pygame.event.get():
@@ -610,7 +769,11 @@ class Game:
                 pygame.display.flip()
                 continue
 
-            self.update(dt)
+            # Fixed-timestep simulation: drain accumulated real time in SIM_STEP slices, render once
+            acc = min(acc + dt, MAX_FRAME_TIME)
+            while acc >= SIM_STEP:
+                self.update(SIM_STEP)
+                acc -= SIM_STEP
             self.render()
             pygame.display.flip()
 